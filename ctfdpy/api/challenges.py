@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Annotated, Literal, Protocol, overload
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Callable, Literal, Protocol, overload
 
 from pydantic import Field, TypeAdapter, ValidationError
 
 from ctfdpy.exceptions import (
+    BASE_ERROR_MAP,
+    DEFAULT_ERROR_MAP,
     BadChallengeAttempt,
     BadRequest,
     Forbidden,
@@ -41,7 +44,7 @@ from ctfdpy.models.hints import Hint
 from ctfdpy.models.tags import Tag
 from ctfdpy.types.api import APIResponse
 from ctfdpy.types.challenges import ChallengeRequirementsDict
-from ctfdpy.utils import MISSING, admin_only
+from ctfdpy.utils import MISSING, admin_only, lazy_type_adapter
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
@@ -51,51 +54,74 @@ class _HasChallengeID(Protocol):
     id: int
 
 
-challenge_listing_adapter: TypeAdapter[AnonymousChallenge | ChallengeListing] = (
-    TypeAdapter(AnonymousChallenge | ChallengeListing)
-)
+get_challenge_listing_list_adapter: Callable[
+    [], TypeAdapter[list[AnonymousChallenge | ChallengeListing]]
+] = lazy_type_adapter(list[AnonymousChallenge | ChallengeListing])
 
 flag_types = str | tuple[str] | tuple[str, FlagType] | tuple[str, FlagType, bool]
 
 challenge_write_result_types = (
     StandardChallengeWriteResult | DynamicChallengeWriteResult
 )
-challenge_write_result_adapter: TypeAdapter[challenge_write_result_types] = TypeAdapter(
+get_challenge_write_result_adapter: Callable[
+    [], TypeAdapter[challenge_write_result_types]
+] = lazy_type_adapter(
     Annotated[challenge_write_result_types, Field(discriminator="type")]
 )
 
-challenge_type_info_list_adapter: TypeAdapter[list[ChallengeTypeInfo]] = TypeAdapter(
-    list[ChallengeTypeInfo]
-)
+get_challenge_type_info_list_adapter: Callable[
+    [], TypeAdapter[list[ChallengeTypeInfo]]
+] = lazy_type_adapter(list[ChallengeTypeInfo])
 
 challenge_types = StandardChallenge | DynamicChallenge | AnonymousChallenge
-challenge_adapter: TypeAdapter[challenge_types] = TypeAdapter(
-    Annotated[challenge_types, Field(discriminator="type")]
-)
-
-challenge_file_location_list_adapter: TypeAdapter[list[ChallengeFileLocation]] = (
-    TypeAdapter(list[ChallengeFileLocation])
+get_challenge_adapter: Callable[[], TypeAdapter[challenge_types]] = (
+    lazy_type_adapter(Annotated[challenge_types, Field(discriminator="type")])
 )
 
-flag_list_adapter: TypeAdapter[list[Flag]] = TypeAdapter(list[Flag])
+get_challenge_file_location_list_adapter: Callable[
+    [], TypeAdapter[list[ChallengeFileLocation]]
+] = lazy_type_adapter(list[ChallengeFileLocation])
 
-hint_list_adapter: TypeAdapter[list[Hint]] = TypeAdapter(list[Hint])
+get_flag_list_adapter: Callable[[], TypeAdapter[list[Flag]]] = lazy_type_adapter(
+    list[Flag]
+)
 
-challenge_solves_list_adapter: TypeAdapter[list[ChallengeSolve]] = TypeAdapter(
-    list[ChallengeSolve]
+get_hint_list_adapter: Callable[[], TypeAdapter[list[Hint]]] = lazy_type_adapter(
+    list[Hint]
 )
 
-tag_list_adapter: TypeAdapter[list[Tag]] = TypeAdapter(list[Tag])
+get_challenge_solves_list_adapter: Callable[
+    [], TypeAdapter[list[ChallengeSolve]]
+] = lazy_type_adapter(list[ChallengeSolve])
 
-challenge_topic_list_adapter: TypeAdapter[list[ChallengeTopic]] = TypeAdapter(
-    list[ChallengeTopic]
+get_tag_list_adapter: Callable[[], TypeAdapter[list[Tag]]] = lazy_type_adapter(
+    list[Tag]
 )
 
+get_challenge_topic_list_adapter: Callable[
+    [], TypeAdapter[list[ChallengeTopic]]
+] = lazy_type_adapter(list[ChallengeTopic])
+
 
 class ChallengesAPI:
     """
     Interface for interacting with the `/api/v1/challenges` CTFd API endpoint.
     """
+
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+    _ATTEMPT_ERRORS = MappingProxyType(
+        {
+            400: BadRequest,
+            401: Unauthorized,
+            403: BadChallengeAttempt,
+            404: NotFound,
+            429: BadChallengeAttempt,
+        }
+    )
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -116,36 +142,32 @@ class ChallengesAPI:
         page: int | None = None,
     ) -> list[AnonymousChallenge, ChallengeListing]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if name is not None:
-            params["name"] = name
-        if max_attempts is not None:
-            params["max_attempts"] = max_attempts
-        if value is not None:
-            params["value"] = value
-        if category is not None:
-            params["category"] = category
-        if type is not None:
-            params["type"] = type.value
-        if state is not None:
-            params["state"] = state.value
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
-        if view is not None:
-            params["view"] = view
-        if page is not None:
-            params["page"] = page
+        params = {
+            k: v
+            for k, v in (
+                ("name", name),
+                ("max_attempts", max_attempts),
+                ("value", value),
+                ("category", category),
+                ("type", type),
+                ("state", state),
+                ("q", q),
+                ("field", field),
+                ("view", view),
+                ("page", page),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/challenges",
-            params=params,
-            response_model=challenge_listing_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_challenge_listing_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     async def async_list(
@@ -165,36 +187,32 @@ class ChallengesAPI:
         page: int | None = None,
     ) -> list[AnonymousChallenge, ChallengeListing]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if name is not None:
-            params["name"] = name
-        if max_attempts is not None:
-            params["max_attempts"] = max_attempts
-        if value is not None:
-            params["value"] = value
-        if category is not None:
-            params["category"] = category
-        if type is not None:
-            params["type"] = type.value
-        if state is not None:
-            params["state"] = state.value
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
-        if view is not None:
-            params["view"] = view
-        if page is not None:
-            params["page"] = page
+        params = {
+            k: v
+            for k, v in (
+                ("name", name),
+                ("max_attempts", max_attempts),
+                ("value", value),
+                ("category", category),
+                ("type", type),
+                ("state", state),
+                ("q", q),
+                ("field", field),
+                ("view", view),
+                ("page", page),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/challenges",
-            params=params,
-            response_model=challenge_listing_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_challenge_listing_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     # Create with standard challenge payload and one flag
@@ -590,9 +608,9 @@ class ChallengesAPI:
         result = self._client.request(
             "POST",
             "/api/v1/challenges",
-            json=payload.dump_json(),
-            response_model=challenge_write_result_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            payload=payload,
+            response_model=get_challenge_write_result_adapter(),
+            error_models=self._ERRORS,
         )
 
         if flags is not None:
@@ -708,9 +726,9 @@ class ChallengesAPI:
         result = await self._client.arequest(
             "POST",
             "/api/v1/challenges",
-            json=payload.dump_json(),
-            response_model=challenge_write_result_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            payload=payload,
+            response_model=get_challenge_write_result_adapter(),
+            error_models=self._ERRORS,
         )
 
         if flags is not None:
@@ -750,13 +768,7 @@ class ChallengesAPI:
                 "/api/v1/challenges/attempt",
                 json={"challenge_id": challenge_id, "submission": submission},
                 response_model=ChallengeAttemptResult,
-                error_models={
-                    400: BadRequest,
-                    401: Unauthorized,
-                    403: BadChallengeAttempt,
-                    404: NotFound,
-                    429: BadChallengeAttempt,
-                },
+                error_models=self._ATTEMPT_ERRORS,
             )
         except BadChallengeAttempt as e:
             # This is cursed
@@ -782,13 +794,7 @@ class ChallengesAPI:
                 "/api/v1/challenges/attempt",
                 json={"challenge_id": challenge_id, "submission": submission},
                 response_model=ChallengeAttemptResult,
-                error_models={
-                    400: BadRequest,
-                    401: Unauthorized,
-                    403: BadChallengeAttempt,
-                    404: NotFound,
-                    429: BadChallengeAttempt,
-                },
+                error_models=self._ATTEMPT_ERRORS,
             )
         except BadChallengeAttempt as e:
             # This is cursed
@@ -810,8 +816,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             "/api/v1/challenges/types",
-            response_model=challenge_type_info_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_type_info_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -819,21 +825,16 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             "/api/v1/challenges/types",
-            response_model=challenge_type_info_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_type_info_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     def get(self, challenge_id: int) -> StandardChallenge | DynamicChallenge:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}",
-            response_model=challenge_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=get_challenge_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     async def async_get(
@@ -842,13 +843,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}",
-            response_model=challenge_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=get_challenge_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     # Update with base challenge payload
@@ -1061,20 +1057,20 @@ class ChallengesAPI:
 
             try:
                 if payload_type is None:
-                    payload = UpdateBaseChallengePayload(**kwargs)
+                    payload = UpdateBaseChallengePayload.model_validate(kwargs)
                 elif payload_type == "standard":
-                    payload = UpdateStandardChallengePayload(**kwargs)
+                    payload = UpdateStandardChallengePayload.model_validate(kwargs)
                 elif payload_type == "dynamic":
-                    payload = UpdateDynamicChallengePayload(**kwargs)
+                    payload = UpdateDynamicChallengePayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return self._client.request(
             "PATCH",
             f"/api/v1/challenges/{challenge_id}",
-            json=payload.dump_json(),
-            response_model=challenge_write_result_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            payload=payload,
+            response_model=get_challenge_write_result_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1127,20 +1123,20 @@ class ChallengesAPI:
 
             try:
                 if payload_type is None:
-                    payload = UpdateBaseChallengePayload(**kwargs)
+                    payload = UpdateBaseChallengePayload.model_validate(kwargs)
                 elif payload_type == "standard":
-                    payload = UpdateStandardChallengePayload(**kwargs)
+                    payload = UpdateStandardChallengePayload.model_validate(kwargs)
                 elif payload_type == "dynamic":
-                    payload = UpdateDynamicChallengePayload(**kwargs)
+                    payload = UpdateDynamicChallengePayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return await self._client.arequest(
             "PATCH",
             f"/api/v1/challenges/{challenge_id}",
-            json=payload.dump_json(),
-            response_model=challenge_write_result_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            payload=payload,
+            response_model=get_challenge_write_result_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1148,7 +1144,7 @@ class ChallengesAPI:
         self._client.request(
             "DELETE",
             f"/api/v1/challenges/{challenge_id}",
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1156,7 +1152,7 @@ class ChallengesAPI:
         await self._client.arequest(
             "DELETE",
             f"/api/v1/challenges/{challenge_id}",
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1164,8 +1160,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/files",
-            response_model=challenge_file_location_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_file_location_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1173,8 +1169,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/files",
-            response_model=challenge_file_location_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_file_location_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1182,8 +1178,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/flags",
-            response_model=flag_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_flag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1191,8 +1187,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/flags",
-            response_model=flag_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_flag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1200,8 +1196,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/hints",
-            response_model=hint_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_hint_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1209,8 +1205,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/hints",
-            response_model=hint_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_hint_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1219,7 +1215,7 @@ class ChallengesAPI:
             "GET",
             f"/api/v1/challenges/{challenge_id}/requirements",
             response_model=ChallengeRequirements,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1228,7 +1224,7 @@ class ChallengesAPI:
             "GET",
             f"/api/v1/challenges/{challenge_id}/requirements",
             response_model=ChallengeRequirements,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1236,8 +1232,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/solves",
-            response_model=challenge_solves_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_solves_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1245,8 +1241,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/solves",
-            response_model=challenge_solves_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_solves_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1254,8 +1250,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/tags",
-            response_model=tag_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_tag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1263,8 +1259,8 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/tags",
-            response_model=tag_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_tag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1272,8 +1268,8 @@ class ChallengesAPI:
         return self._client.request(
             "GET",
             f"/api/v1/challenges/{challenge_id}/topics",
-            response_model=challenge_topic_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_topic_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -1281,6 +1277,6 @@ class ChallengesAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/challenges/{challenge_id}/topics",
-            response_model=challenge_topic_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_challenge_topic_list_adapter(),
+            error_models=self._ERRORS,
         )
@@ -1,18 +1,14 @@
 from __future__ import annotations
 
 import os
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Literal, overload
 
-from pydantic import Field, TypeAdapter, ValidationError
+from pydantic import Field, ValidationError
 
-from ctfdpy.exceptions import (
-    BadRequest,
-    Forbidden,
-    ModelValidationError,
-    NotFound,
-    Unauthorized,
-)
+from ctfdpy.exceptions import BASE_ERROR_MAP, DEFAULT_ERROR_MAP, ModelValidationError
 from ctfdpy.models.files import (
     BaseFile,
     ChallengeFile,
@@ -22,14 +18,22 @@ from ctfdpy.models.files import (
     PageFile,
     StandardFile,
 )
-from ctfdpy.utils import MISSING, admin_only
+from ctfdpy.types.files import CreateFilePayloadDict
+from ctfdpy.utils import (
+    DEFAULT_CONCURRENCY,
+    MISSING,
+    admin_only,
+    async_run_concurrently,
+    lazy_type_adapter,
+    run_concurrently,
+)
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
-list_create_file_adapter = TypeAdapter(list[BaseFile])
+get_list_create_file_adapter = lazy_type_adapter(list[BaseFile])
 
-list_file_adapter = TypeAdapter(
+get_list_file_adapter = lazy_type_adapter(
     list[
         Annotated[
             StandardFile | ChallengeFile | PageFile, Field(..., discriminator="type")
@@ -37,16 +41,24 @@ list_file_adapter = TypeAdapter(
     ]
 )
 
-file_adapter = TypeAdapter(
+get_file_adapter = lazy_type_adapter(
     Annotated[StandardFile | ChallengeFile | PageFile, Field(..., discriminator="type")]
 )
 
+# Maximum number of files uploaded concurrently when creating multiple files
+MAX_CONCURRENT_UPLOADS = 8
+
 
 class FilesAPI:
     """
     Interface for interacting with the `/api/v1/files` CTFd API endpoint.
     """
 
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -106,24 +118,26 @@ class FilesAPI:
         ```
         """
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if location is not None:
-            params["location"] = location
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("location", location),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/files",
-            params=params,
-            response_model=list_file_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_list_file_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -182,24 +196,26 @@ class FilesAPI:
         ```
         """
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if location is not None:
-            params["location"] = location
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("location", location),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/files",
-            params=params,
-            response_model=list_file_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_list_file_adapter(),
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -259,6 +275,11 @@ class FilesAPI:
 
         Create a new file.
 
+        When multiple files are provided, each file is uploaded in a separate request,
+        with up to `MAX_CONCURRENT_UPLOADS` uploads running concurrently. This is not
+        all-or-nothing: if one upload fails, the remaining uploads are cancelled, but the
+        files that were already uploaded stay on the server and only the exception is raised.
+
         Parameters
         ----------
         payload: CreateFilePayload
@@ -309,39 +330,46 @@ class FilesAPI:
         )
         ```
         """
-        if payload is MISSING:
-            files = files or []
-
-            if file_paths is not None:
-                for file_path in file_paths:
-                    file_path = Path(file_path)
-                    if not file_path.exists():
-                        raise FileNotFoundError(f"File not found: {file_path}")
-                    files.append((file_path.name, file_path.open("rb")))
-
-            if len(files) == 0:
-                raise ValueError("At least one file must be provided")
-
-            try:
-                payload = CreateFilePayload(
-                    files=files,
-                    type=type,
-                    challenge_id=challenge_id or challenge,
-                    page_id=page_id or page,
-                    location=location,
-                )
-            except ValidationError as e:
-                raise ModelValidationError(e.errors()) from e
-
-        return self._client.request(
-            "POST",
-            "/api/v1/files",
-            data=payload.data_payload,
-            files=payload.files_payload,  # we can't use payload.dump_json() here, see https://github.com/pydantic/pydantic/issues/8907
-            headers={"Content-Type": "multipart/form-data"},
-            response_model=list_create_file_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
-        )
+        # Files opened from `file_paths` are owned by us and are closed once the upload is done
+        with ExitStack() as stack:
+            if payload is MISSING:
+                # Copy the list so that the caller's list is not modified
+                files = list(files or [])
+
+                if file_paths is not None:
+                    for file_path in file_paths:
+                        file_path = Path(file_path)
+                        try:
+                            file = stack.enter_context(file_path.open("rb"))
+                        except FileNotFoundError as e:
+                            raise FileNotFoundError(
+                                f"File not found: {file_path}"
+                            ) from e
+                        files.append((file_path.name, file))
+
+                if len(files) == 0:
+                    raise ValueError("At least one file must be provided")
+
+                try:
+                    payload = CreateFilePayload(
+                        files=files,
+                        type=type,
+                        challenge_id=challenge_id or challenge,
+                        page_id=page_id or page,
+                        location=location,
+                    )
+                except ValidationError as e:
+                    raise ModelValidationError(e.errors()) from e
+
+            # Upload each file in its own request so that the transfers overlap
+            results = run_concurrently(
+                self._client,
+                partial(self._upload, payload.data_payload),
+                payload.files,
+                concurrency=MAX_CONCURRENT_UPLOADS,
+            )
+
+        return [created for result in results for created in result]
 
     @admin_only
     async def async_create(
@@ -362,6 +390,11 @@ class FilesAPI:
 
         Create a new file.
 
+        When multiple files are provided, each file is uploaded in a separate request,
+        with up to `MAX_CONCURRENT_UPLOADS` uploads running concurrently. This is not
+        all-or-nothing: if one upload fails, the remaining uploads are cancelled, but the
+        files that were already uploaded stay on the server and only the exception is raised.
+
         Parameters
         ----------
         payload: CreateFilePayload
@@ -412,38 +445,69 @@ class FilesAPI:
         )
         ```
         """
-        if payload is MISSING:
-            files = files or []
-
-            if file_paths is not None:
-                for file_path in file_paths:
-                    file_path = Path(file_path)
-                    if not file_path.exists():
-                        raise FileNotFoundError(f"File not found: {file_path}")
-                    files.append((file_path.name, file_path.open("rb")))
-
-            if len(files) == 0:
-                raise ValueError("At least one file must be provided")
-
-            try:
-                payload = CreateFilePayload(
-                    files=files,
-                    type=type,
-                    challenge_id=challenge_id or challenge,
-                    page_id=page_id or page,
-                    location=location,
-                )
-            except ValidationError as e:
-                raise ModelValidationError(e.errors()) from e
+        # Files opened from `file_paths` are owned by us and are closed once the upload is done
+        with ExitStack() as stack:
+            if payload is MISSING:
+                # Copy the list so that the caller's list is not modified
+                files = list(files or [])
+
+                if file_paths is not None:
+                    for file_path in file_paths:
+                        file_path = Path(file_path)
+                        try:
+                            file = stack.enter_context(file_path.open("rb"))
+                        except FileNotFoundError as e:
+                            raise FileNotFoundError(
+                                f"File not found: {file_path}"
+                            ) from e
+                        files.append((file_path.name, file))
+
+                if len(files) == 0:
+                    raise ValueError("At least one file must be provided")
+
+                try:
+                    payload = CreateFilePayload(
+                        files=files,
+                        type=type,
+                        challenge_id=challenge_id or challenge,
+                        page_id=page_id or page,
+                        location=location,
+                    )
+                except ValidationError as e:
+                    raise ModelValidationError(e.errors()) from e
+
+            # Upload each file in its own request so that the transfers overlap
+            results = await async_run_concurrently(
+                self._client,
+                partial(self._async_upload, payload.data_payload),
+                payload.files,
+                concurrency=MAX_CONCURRENT_UPLOADS,
+            )
+
+        return [created for result in results for created in result]
+
+    def _upload(
+        self, data: CreateFilePayloadDict, file: MultipartFileTypes
+    ) -> list[BaseFile]:
+        return self._client.request(
+            "POST",
+            "/api/v1/files",
+            data=data,
+            files=[("file", file)],  # we can't use payload.dump_json() here, see https://github.com/pydantic/pydantic/issues/8907
+            response_model=get_list_create_file_adapter(),
+            error_models=self._ERRORS,
+        )
 
+    async def _async_upload(
+        self, data: CreateFilePayloadDict, file: MultipartFileTypes
+    ) -> list[BaseFile]:
         return await self._client.arequest(
             "POST",
             "/api/v1/files",
-            data=payload.data_payload,
-            files=payload.files_payload,  # we can't use payload.dump_json() here, see https://github.com/pydantic/pydantic/issues/8907
-            headers={"Content-Type": "multipart/form-data"},
-            response_model=list_create_file_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            data=data,
+            files=[("file", file)],  # we can't use payload.dump_json() here, see https://github.com/pydantic/pydantic/issues/8907
+            response_model=get_list_create_file_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -484,14 +548,9 @@ class FilesAPI:
         """
         return self._client.request(
             "GET",
-            f"/api/v1/files/{file_id}",
-            response_model=file_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/files/" + str(file_id),
+            response_model=get_file_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -532,14 +591,97 @@ class FilesAPI:
         """
         return await self._client.arequest(
             "GET",
-            f"/api/v1/files/{file_id}",
-            response_model=file_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/files/" + str(file_id),
+            response_model=get_file_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
+        )
+
+    @admin_only
+    def get_many(
+        self, file_ids: list[int], *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[StandardFile | ChallengeFile | PageFile]:
+        """
+        !!! note "This method is only available to admins"
+
+        Get multiple files by their IDs, sending the requests concurrently.
+
+        Parameters
+        ----------
+        file_ids: list[int]
+            The IDs of the files to get
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[StandardFile | ChallengeFile | PageFile]
+            The files, in the same order as the IDs
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        NotFound
+            A file with one of the provided IDs does not exist.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+
+        Examples
+        --------
+        Get multiple files by their IDs:
+
+        ```python
+        files = ctfd.files.get_many([1, 2, 3])
+        ```
+        """
+        return run_concurrently(
+            self._client, self.get, file_ids, concurrency=concurrency
+        )
+
+    @admin_only
+    async def async_get_many(
+        self, file_ids: list[int], *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[StandardFile | ChallengeFile | PageFile]:
+        """
+        !!! note "This method is only available to admins"
+
+        Get multiple files by their IDs, sending the requests concurrently.
+
+        Parameters
+        ----------
+        file_ids: list[int]
+            The IDs of the files to get
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[StandardFile | ChallengeFile | PageFile]
+            The files, in the same order as the IDs
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        NotFound
+            A file with one of the provided IDs does not exist.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+
+        Examples
+        --------
+        Get multiple files by their IDs:
+
+        ```python
+        files = await ctfd.files.async_get_many([1, 2, 3])
+        ```
+        """
+        return await async_run_concurrently(
+            self._client, self.async_get, file_ids, concurrency=concurrency
         )
 
     @admin_only
@@ -580,13 +722,8 @@ class FilesAPI:
         """
         return self._client.request(
             "DELETE",
-            f"/api/v1/files/{file_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/files/" + str(file_id),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -627,11 +764,6 @@ class FilesAPI:
         """
         return await self._client.arequest(
             "DELETE",
-            f"/api/v1/files/{file_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/files/" + str(file_id),
+            error_models=self._NOT_FOUND_ERRORS,
         )
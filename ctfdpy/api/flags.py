@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Literal, overload
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from ctfdpy.exceptions import (
+    BASE_ERROR_MAP,
+    DEFAULT_ERROR_MAP,
     BadRequest,
     Forbidden,
     ModelValidationError,
@@ -18,21 +21,35 @@ from ctfdpy.models.flags import (
     FlagTypeInfo,
     UpdateFlagPayload,
 )
-from ctfdpy.utils import MISSING, admin_only
+from ctfdpy.utils import MISSING, admin_only, lazy_type_adapter
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 
-flag_list_adapter = TypeAdapter(list[Flag])
+get_flag_list_adapter = lazy_type_adapter(list[Flag])
 
-flag_type_info_dict_adapter = TypeAdapter(dict[str, FlagTypeInfo])
+get_flag_type_info_dict_adapter = lazy_type_adapter(dict[str, FlagTypeInfo])
 
 
 class FlagsAPI:
     """
     Interface for interacting with the `/api/v1/flags` CTFd API endpoint.
     """
+
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+    _FLAG_TYPE_ERRORS = MappingProxyType(
+        {
+            400: BadRequest,
+            401: Unauthorized,
+            403: Forbidden,
+            500: NotFound,  # it raises KeyError when the flag type does not exist
+        }
+    )
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -48,33 +65,28 @@ class FlagsAPI:
         field: Literal["type", "content", "data"] | None = None,
     ) -> list[Flag]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if content is not None:
-            params["content"] = content
-        if data is not None:
-            params["data"] = data
-
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("challenge_id", challenge_id),
+                ("content", content),
+                ("data", data),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/flags",
-            params=params,
-            response_model=flag_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_flag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -89,33 +101,28 @@ class FlagsAPI:
         field: Literal["type", "content", "data"] | None = None,
     ) -> list[Flag]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if content is not None:
-            params["content"] = content
-        if data is not None:
-            params["data"] = data
-
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("challenge_id", challenge_id),
+                ("content", content),
+                ("data", data),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/flags",
-            params=params,
-            response_model=flag_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_flag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -169,13 +176,9 @@ class FlagsAPI:
         return self._client.request(
             "POST",
             "/api/v1/flags",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -203,13 +206,9 @@ class FlagsAPI:
         return await self._client.arequest(
             "POST",
             "/api/v1/flags",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -217,8 +216,8 @@ class FlagsAPI:
         return self._client.request(
             "GET",
             "/api/v1/flags/types",
-            response_model=flag_type_info_dict_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_flag_type_info_dict_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -226,8 +225,8 @@ class FlagsAPI:
         return await self._client.arequest(
             "GET",
             "/api/v1/flags/types",
-            response_model=flag_type_info_dict_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            response_model=get_flag_type_info_dict_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -236,12 +235,7 @@ class FlagsAPI:
             "GET",
             f"/api/v1/flags/types/{type}",
             response_model=FlagTypeInfo,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                500: NotFound,  # it raises KeyError when the flag type does not exist
-            },
+            error_models=self._FLAG_TYPE_ERRORS,
         )
 
     @admin_only
@@ -250,12 +244,7 @@ class FlagsAPI:
             "GET",
             f"/api/v1/flags/types/{type}",
             response_model=FlagTypeInfo,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                500: NotFound,  # it raises KeyError when the flag type does not exist
-            },
+            error_models=self._FLAG_TYPE_ERRORS,
         )
 
     @admin_only
@@ -264,12 +253,7 @@ class FlagsAPI:
             "GET",
             f"/api/v1/flags/{flag_id}",
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -278,12 +262,7 @@ class FlagsAPI:
             "GET",
             f"/api/v1/flags/{flag_id}",
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @overload
@@ -329,21 +308,16 @@ class FlagsAPI:
             if case_insensitive is not MISSING:
                 kwargs["data"] = "case_insensitive" if case_insensitive else ""
             try:
-                payload = UpdateFlagPayload(**kwargs)
+                payload = UpdateFlagPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return self._client.request(
             "PATCH",
             f"/api/v1/flags/{flag_id}",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -359,21 +333,16 @@ class FlagsAPI:
             if case_insensitive is not MISSING:
                 kwargs["data"] = "case_insensitive" if case_insensitive else ""
             try:
-                payload = UpdateFlagPayload(**kwargs)
+                payload = UpdateFlagPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return await self._client.arequest(
             "PATCH",
             f"/api/v1/flags/{flag_id}",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Flag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -381,12 +350,7 @@ class FlagsAPI:
         return self._client.request(
             "DELETE",
             f"/api/v1/flags/{flag_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -394,10 +358,5 @@ class FlagsAPI:
         return await self._client.arequest(
             "DELETE",
             f"/api/v1/flags/{flag_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
@@ -2,15 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal, overload
 
-from pydantic import TypeAdapter, ValidationError
-
-from ctfdpy.exceptions import (
-    BadRequest,
-    Forbidden,
-    ModelValidationError,
-    NotFound,
-    Unauthorized,
-)
+from pydantic import ValidationError
+
+from ctfdpy.exceptions import BASE_ERROR_MAP, DEFAULT_ERROR_MAP, ModelValidationError
 from ctfdpy.models.hints import (
     CreateHintPayload,
     Hint,
@@ -19,16 +13,23 @@ from ctfdpy.models.hints import (
     UnlockedHint,
     UpdateHintPayload,
 )
-from ctfdpy.utils import MISSING, admin_only
+from ctfdpy.utils import (
+    DEFAULT_CONCURRENCY,
+    MISSING,
+    admin_only,
+    async_run_concurrently,
+    lazy_type_adapter,
+    run_concurrently,
+)
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 
-locked_hint_list_adapter = TypeAdapter(list[LockedHint])
+get_locked_hint_list_adapter = lazy_type_adapter(list[LockedHint])
 
 # TODO: Optimize TypeAdapters using discriminators
-hint_adapter = TypeAdapter(Hint | UnlockedHint | LockedHint)
+get_hint_adapter = lazy_type_adapter(Hint | UnlockedHint | LockedHint)
 
 
 class HintsAPI:
@@ -36,6 +37,11 @@ class HintsAPI:
     Interface for interacting with the `/api/v1/hints` CTFd API endpoint.
     """
 
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -89,28 +95,28 @@ class HintsAPI:
             You must be an admin to access this resource.
         """
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if content is not None:
-            params["content"] = content
-        if cost is not None:
-            params["cost"] = cost
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("challenge_id", challenge_id),
+                ("content", content),
+                ("cost", cost),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/hints",
-            params=params,
-            response_model=locked_hint_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_locked_hint_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -163,28 +169,28 @@ class HintsAPI:
             You must be an admin to access this resource.
         """
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if type is not None:
-            params["type"] = type.value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if content is not None:
-            params["content"] = content
-        if cost is not None:
-            params["cost"] = cost
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("type", type),
+                ("challenge_id", challenge_id),
+                ("content", content),
+                ("cost", cost),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/hints",
-            params=params,
-            response_model=locked_hint_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_locked_hint_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -277,9 +283,9 @@ class HintsAPI:
         return self._client.request(
             "POST",
             "/api/v1/hints",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Hint,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -344,9 +350,95 @@ class HintsAPI:
         return await self._client.arequest(
             "POST",
             "/api/v1/hints",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=Hint,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
+        )
+
+    @admin_only
+    def create_many(
+        self,
+        payloads: list[CreateHintPayload],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Hint]:
+        """
+        !!! note "This method is only available to admins"
+
+        Create multiple hints, sending the requests concurrently.
+
+        If a request fails, the remaining requests are cancelled and the exception is raised.
+        Hints that were already created are not deleted.
+
+        Parameters
+        ----------
+        payloads: list[CreateHintPayload]
+            The payloads to create the hints with
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[Hint]
+            The created hints, in the same order as the payloads
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+        """
+        return run_concurrently(
+            self._client,
+            lambda payload: self.create(payload=payload),
+            payloads,
+            concurrency=concurrency,
+        )
+
+    @admin_only
+    async def async_create_many(
+        self,
+        payloads: list[CreateHintPayload],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Hint]:
+        """
+        !!! note "This method is only available to admins"
+
+        Create multiple hints, sending the requests concurrently.
+
+        If a request fails, the remaining requests are cancelled and the exception is raised.
+        Hints that were already created are not deleted.
+
+        Parameters
+        ----------
+        payloads: list[CreateHintPayload]
+            The payloads to create the hints with
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[Hint]
+            The created hints, in the same order as the payloads
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+        """
+        return await async_run_concurrently(
+            self._client,
+            lambda payload: self.async_create(payload=payload),
+            payloads,
+            concurrency=concurrency,
         )
 
     @admin_only
@@ -379,14 +471,9 @@ class HintsAPI:
         """
         return self._client.request(
             "GET",
-            f"/api/v1/hints/{hint_id}",
-            response_model=hint_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/hints/" + str(hint_id),
+            response_model=get_hint_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -419,14 +506,9 @@ class HintsAPI:
         """
         return await self._client.arequest(
             "GET",
-            f"/api/v1/hints/{hint_id}",
-            response_model=hint_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/hints/" + str(hint_id),
+            response_model=get_hint_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @overload
@@ -511,21 +593,16 @@ class HintsAPI:
         """
         if payload is MISSING:
             try:
-                payload = UpdateHintPayload(**kwargs)
+                payload = UpdateHintPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return self._client.request(
             "PATCH",
-            f"/api/v1/hints/{hint_id}",
-            json=payload.dump_json(),
+            "/api/v1/hints/" + str(hint_id),
+            payload=payload,
             response_model=Hint,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -578,21 +655,104 @@ class HintsAPI:
         """
         if payload is MISSING:
             try:
-                payload = UpdateHintPayload(**kwargs)
+                payload = UpdateHintPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return await self._client.arequest(
             "PATCH",
-            f"/api/v1/hints/{hint_id}",
-            json=payload.dump_json(),
+            "/api/v1/hints/" + str(hint_id),
+            payload=payload,
             response_model=Hint,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
+        )
+
+    @admin_only
+    def get_many(
+        self, hint_ids: list[int], *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[Hint | LockedHint | UnlockedHint]:
+        """
+        !!! note "This method is only available to admins"
+
+        Get multiple hints by their IDs, sending the requests concurrently.
+
+        Parameters
+        ----------
+        hint_ids: list[int]
+            The IDs of the hints to get
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[Hint | LockedHint | UnlockedHint]
+            The hints, in the same order as the IDs
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        NotFound
+            A hint with one of the provided IDs does not exist.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+
+        Examples
+        --------
+        Get multiple hints by their IDs:
+
+        ```python
+        hints = ctfd.hints.get_many([1, 2, 3])
+        ```
+        """
+        return run_concurrently(
+            self._client, self.get, hint_ids, concurrency=concurrency
+        )
+
+    @admin_only
+    async def async_get_many(
+        self, hint_ids: list[int], *, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> list[Hint | LockedHint | UnlockedHint]:
+        """
+        !!! note "This method is only available to admins"
+
+        Get multiple hints by their IDs, sending the requests concurrently.
+
+        Parameters
+        ----------
+        hint_ids: list[int]
+            The IDs of the hints to get
+        concurrency: int
+            The maximum number of requests in flight at once, defaults to 8
+
+        Returns
+        -------
+        list[Hint | LockedHint | UnlockedHint]
+            The hints, in the same order as the IDs
+
+        Raises
+        ------
+        BadRequest
+            An error occurred processing the provided or stored data.
+        NotFound
+            A hint with one of the provided IDs does not exist.
+        AuthenticationRequired
+            You must be logged in to access this resource.
+        AdminOnly
+            You must be an admin to access this resource.
+
+        Examples
+        --------
+        Get multiple hints by their IDs:
+
+        ```python
+        hints = await ctfd.hints.async_get_many([1, 2, 3])
+        ```
+        """
+        return await async_run_concurrently(
+            self._client, self.async_get, hint_ids, concurrency=concurrency
         )
 
     @admin_only
@@ -625,13 +785,8 @@ class HintsAPI:
         """
         return self._client.request(
             "DELETE",
-            f"/api/v1/hints/{hint_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/hints/" + str(hint_id),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -664,11 +819,6 @@ class HintsAPI:
         """
         return await self._client.arequest(
             "DELETE",
-            f"/api/v1/hints/{hint_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            "/api/v1/hints/" + str(hint_id),
+            error_models=self._NOT_FOUND_ERRORS,
         )
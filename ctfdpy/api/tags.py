@@ -2,23 +2,27 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-from pydantic import TypeAdapter
-
-from ctfdpy.exceptions import BadRequest, Forbidden, NotFound, Unauthorized
+from ctfdpy.exceptions import BASE_ERROR_MAP, DEFAULT_ERROR_MAP
 from ctfdpy.models.tags import Tag
-from ctfdpy.utils import MISSING, admin_only
+from ctfdpy.utils import MISSING, admin_only, lazy_type_adapter
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 
-tag_list_adapter = TypeAdapter(list[Tag])
+get_tag_list_adapter = lazy_type_adapter(list[Tag])
 
 
 class TagsAPI:
     """
     Interface for interacting with the `/api/v1/tags` CTFd API endpoint.
     """
+
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -32,28 +36,26 @@ class TagsAPI:
         field: Literal["value", "challenge_id"] | None = None,
     ) -> list[Tag]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if value is not None:
-            params["value"] = value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("value", value),
+                ("challenge_id", challenge_id),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/tags",
-            params=params,
-            model=tag_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_tag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -66,28 +68,26 @@ class TagsAPI:
         field: Literal["value", "challenge_id"] | None = None,
     ) -> list[Tag]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if value is not None:
-            params["value"] = value
-        if challenge_id is not None:
-            params["challenge_id"] = challenge_id
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
-
-        return await self._client.request(
+        params = {
+            k: v
+            for k, v in (
+                ("value", value),
+                ("challenge_id", challenge_id),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
+
+        return await self._client.arequest(
             "GET",
             "/api/v1/tags",
-            params=params,
-            model=tag_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_tag_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -97,17 +97,17 @@ class TagsAPI:
             "/api/v1/tags",
             json={"value": value, "challenge_id": challenge_id},
             response_model=Tag,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
     async def async_create(self, value: str, challenge_id: int) -> Tag:
-        return await self._client.request(
+        return await self._client.arequest(
             "POST",
             "/api/v1/tags",
             json={"value": value, "challenge_id": challenge_id},
             response_model=Tag,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -116,26 +116,16 @@ class TagsAPI:
             "GET",
             f"/api/v1/tags/{tag_id}",
             response_model=Tag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
     async def async_get(self, tag_id: int) -> Tag:
-        return await self._client.request(
+        return await self._client.arequest(
             "GET",
             f"/api/v1/tags/{tag_id}",
             response_model=Tag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -158,12 +148,7 @@ class TagsAPI:
             f"/api/v1/tags/{tag_id}",
             json=payload,
             response_model=Tag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -181,17 +166,12 @@ class TagsAPI:
             # I have no idea what would happen if this is changed
             payload["challenge_id"] = challenge_id
 
-        return await self._client.request(
+        return await self._client.arequest(
             "PATCH",
             f"/api/v1/tags/{tag_id}",
             json=payload,
             response_model=Tag,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -199,23 +179,13 @@ class TagsAPI:
         return self._client.request(
             "DELETE",
             f"/api/v1/tags/{tag_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
     async def async_delete(self, tag_id: int) -> Literal[True]:
-        return await self._client.request(
+        return await self._client.arequest(
             "DELETE",
             f"/api/v1/tags/{tag_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
@@ -2,24 +2,28 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal, overload
 
-from pydantic import TypeAdapter
-
-from ctfdpy.exceptions import BadRequest, Forbidden, NotFound, Unauthorized
+from ctfdpy.exceptions import BASE_ERROR_MAP, DEFAULT_ERROR_MAP, BadRequest
 from ctfdpy.models.topics import ChallengeTopicReference, Topic
 from ctfdpy.types.api import APIResponse
-from ctfdpy.utils import admin_only
+from ctfdpy.utils import admin_only, lazy_type_adapter
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 
-topic_list_adapter = TypeAdapter(list[Topic])
+get_topic_list_adapter = lazy_type_adapter(list[Topic])
 
 
 class TopicsAPI:
     """
     Interface for interacting with the `/api/v1/topics` CTFd API endpoint.
     """
+
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -32,27 +36,25 @@ class TopicsAPI:
         field: Literal["value"] | None = None,
     ) -> list[Topic]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if value is not None:
-            params["value"] = value
-
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("value", value),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/topics",
-            params=params,
-            model=topic_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_topic_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -64,27 +66,25 @@ class TopicsAPI:
         field: Literal["value"] | None = None,
     ) -> list[Topic]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if value is not None:
-            params["value"] = value
-
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
+        params = {
+            k: v
+            for k, v in (
+                ("value", value),
+                ("q", q),
+                ("field", field),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/topics",
-            params=params,
-            model=topic_list_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-            },
+            params=params or None,
+            response_model=get_topic_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -140,13 +140,8 @@ class TopicsAPI:
                 "POST",
                 "/api/v1/topics",
                 json=params,
-                model=ChallengeTopicReference,
-                error_models={
-                    400: BadRequest,
-                    401: Unauthorized,
-                    403: Forbidden,
-                    404: NotFound,
-                },
+                response_model=ChallengeTopicReference,
+                error_models=self._NOT_FOUND_ERRORS,
             )
         except BadRequest as e:
             response: APIResponse = e.response.json()
@@ -180,13 +175,8 @@ class TopicsAPI:
                 "POST",
                 "/api/v1/topics",
                 json=params,
-                model=ChallengeTopicReference,
-                error_models={
-                    400: BadRequest,
-                    401: Unauthorized,
-                    403: Forbidden,
-                    404: NotFound,
-                },
+                response_model=ChallengeTopicReference,
+                error_models=self._NOT_FOUND_ERRORS,
             )
         except BadRequest as e:
             response: APIResponse = e.response.json()
@@ -206,12 +196,7 @@ class TopicsAPI:
                 "type": "challenge",
                 "target_id": challenge_topic_id,
             },
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -225,12 +210,7 @@ class TopicsAPI:
                 "type": "challenge",
                 "target_id": challenge_topic_id,
             },
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -238,13 +218,8 @@ class TopicsAPI:
         return self._client.request(
             "GET",
             f"/api/v1/topics/{topic_id}",
-            model=Topic,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=Topic,
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -252,13 +227,8 @@ class TopicsAPI:
         return await self._client.arequest(
             "GET",
             f"/api/v1/topics/{topic_id}",
-            model=Topic,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=Topic,
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -266,12 +236,7 @@ class TopicsAPI:
         return self._client.request(
             "DELETE",
             f"/api/v1/topics/{topic_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -279,10 +244,5 @@ class TopicsAPI:
         return await self._client.arequest(
             "DELETE",
             f"/api/v1/topics/{topic_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
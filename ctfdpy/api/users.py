@@ -1,16 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, overload
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
-from ctfdpy.exceptions import (
-    BadRequest,
-    Forbidden,
-    ModelValidationError,
-    NotFound,
-    Unauthorized,
-)
+from ctfdpy.exceptions import BASE_ERROR_MAP, DEFAULT_ERROR_MAP, ModelValidationError
 from ctfdpy.models.users import (
     CreateUserPayload,
     UpdateSelfUserPayload,
@@ -21,21 +15,37 @@ from ctfdpy.models.users import (
     UserPublicView,
     UserType,
 )
-from ctfdpy.utils import MISSING, admin_only, auth_only
+from ctfdpy.utils import (
+    DEFAULT_CONCURRENCY,
+    MISSING,
+    admin_only,
+    async_run_concurrently,
+    auth_only,
+    lazy_type_adapter,
+    run_concurrently,
+)
 
 if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 
-user_listing_list_adapter = TypeAdapter(list[UserListing])
+get_user_listing_list_adapter = lazy_type_adapter(list[UserListing])
+
+get_user_adapter = lazy_type_adapter(UserPublicView | UserAdminView)
 
-user_adapter = TypeAdapter(UserPublicView | UserAdminView)
+get_create_user_payload_list_adapter = lazy_type_adapter(list[CreateUserPayload])
 
 
 class UsersAPI:
     """
     Interface for interacting with the `/api/v1/users` CTFd API endpoint.
     """
+
+    __slots__ = ("_client",)
+
+    _ERRORS = BASE_ERROR_MAP
+    _NOT_FOUND_ERRORS = DEFAULT_ERROR_MAP
+
     def __init__(self, client: APIClient):
         self._client = client
 
@@ -54,30 +64,29 @@ class UsersAPI:
         page: int | None = None,
     ) -> list[UserListing]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if affiliation is not None:
-            params["affiliation"] = affiliation
-        if country is not None:
-            params["country"] = country
-        if bracket is not None:
-            params["bracket"] = bracket
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
-        if view is not None:
-            params["view"] = view
-        if page is not None:
-            params["page"] = page
+        params = {
+            k: v
+            for k, v in (
+                ("affiliation", affiliation),
+                ("country", country),
+                ("bracket", bracket),
+                ("q", q),
+                ("field", field),
+                ("view", view),
+                ("page", page),
+            )
+            if v is not None
+        }
 
         return self._client.request(
             "GET",
             "/api/v1/users",
-            params=params,
-            response_model=user_listing_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_user_listing_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     async def async_list(
@@ -95,30 +104,29 @@ class UsersAPI:
         page: int | None = None,
     ) -> list[UserListing]:
         # Check if q and field are both provided or both not provided
-        if q is None != field is None:
+        if (q is None) != (field is None):
             raise ValueError("q and field must be provided together")
 
-        params = {}
-        if affiliation is not None:
-            params["affiliation"] = affiliation
-        if country is not None:
-            params["country"] = country
-        if bracket is not None:
-            params["bracket"] = bracket
-        if q is not None:
-            params["q"] = q
-            params["field"] = field
-        if view is not None:
-            params["view"] = view
-        if page is not None:
-            params["page"] = page
+        params = {
+            k: v
+            for k, v in (
+                ("affiliation", affiliation),
+                ("country", country),
+                ("bracket", bracket),
+                ("q", q),
+                ("field", field),
+                ("view", view),
+                ("page", page),
+            )
+            if v is not None
+        }
 
         return await self._client.arequest(
             "GET",
             "/api/v1/users",
-            params=params,
-            response_model=user_listing_list_adapter,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            params=params or None,
+            response_model=get_user_listing_list_adapter(),
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -188,17 +196,17 @@ class UsersAPI:
                 "POST",
                 "/api/v1/users",
                 params={"notify": "true"},
-                json=payload.dump_json(),
+                payload=payload,
                 response_model=UserAdminView,
-                error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+                error_models=self._ERRORS,
             )
         else:
             return self._client.request(
                 "POST",
                 "/api/v1/users",
-                json=payload.dump_json(),
+                payload=payload,
                 response_model=UserAdminView,
-                error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+                error_models=self._ERRORS,
             )
 
     @admin_only
@@ -220,26 +228,65 @@ class UsersAPI:
                 "POST",
                 "/api/v1/users",
                 params={"notify": "true"},
-                json=payload.dump_json(),
+                payload=payload,
                 response_model=UserAdminView,
-                error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+                error_models=self._ERRORS,
             )
         else:
             return await self._client.arequest(
                 "POST",
                 "/api/v1/users",
-                json=payload.dump_json(),
+                payload=payload,
                 response_model=UserAdminView,
-                error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+                error_models=self._ERRORS,
             )
 
+    def _validate_payloads(
+        self, payloads: list[CreateUserPayload | dict[str, Any]]
+    ) -> list[CreateUserPayload]:
+        # Validate everything up front so a bad entry fails before any user is created
+        try:
+            return get_create_user_payload_list_adapter().validate_python(payloads)
+        except ValidationError as e:
+            raise ModelValidationError(e.errors()) from e
+
+    @admin_only
+    def create_many(
+        self,
+        payloads: list[CreateUserPayload | dict[str, Any]],
+        *,
+        notify: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[UserAdminView]:
+        return run_concurrently(
+            self._client,
+            lambda payload: self.create(payload=payload, notify=notify),
+            self._validate_payloads(payloads),
+            concurrency=concurrency,
+        )
+
+    @admin_only
+    async def async_create_many(
+        self,
+        payloads: list[CreateUserPayload | dict[str, Any]],
+        *,
+        notify: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[UserAdminView]:
+        return await async_run_concurrently(
+            self._client,
+            lambda payload: self.async_create(payload=payload, notify=notify),
+            self._validate_payloads(payloads),
+            concurrency=concurrency,
+        )
+
     @auth_only
     def get_self(self) -> UserPrivateView:
         return self._client.request(
             "GET",
             "/api/v1/users/me",
             response_model=UserPrivateView,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @auth_only
@@ -248,7 +295,7 @@ class UsersAPI:
             "GET",
             "/api/v1/users/me",
             response_model=UserPrivateView,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @overload
@@ -300,16 +347,16 @@ class UsersAPI:
     ) -> UserPrivateView:
         if payload is None:
             try:
-                payload = UpdateSelfUserPayload(**kwargs)
+                payload = UpdateSelfUserPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return self._client.request(
             "PATCH",
             "/api/v1/users/me",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=UserPrivateView,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @auth_only
@@ -340,26 +387,16 @@ class UsersAPI:
         return self._client.request(
             "GET",
             f"/api/v1/users/{user_id}",
-            response_model=user_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=get_user_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     async def async_get(self, user_id: int) -> UserPublicView | UserAdminView:
         return await self._client.arequest(
             "GET",
             f"/api/v1/users/{user_id}",
-            response_model=user_adapter,
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            response_model=get_user_adapter(),
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @overload
@@ -422,16 +459,16 @@ class UsersAPI:
     ) -> UserAdminView:
         if payload is MISSING:
             try:
-                payload = UpdateUserPayload(**kwargs)
+                payload = UpdateUserPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return self._client.request(
             "PATCH",
             f"/api/v1/users/{user_id}",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=UserAdminView,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -444,16 +481,16 @@ class UsersAPI:
     ) -> UserAdminView:
         if payload is MISSING:
             try:
-                payload = UpdateUserPayload(**kwargs)
+                payload = UpdateUserPayload.model_validate(kwargs)
             except ValidationError as e:
                 raise ModelValidationError(e.errors()) from e
 
         return await self._client.arequest(
             "PATCH",
             f"/api/v1/users/{user_id}",
-            json=payload.dump_json(),
+            payload=payload,
             response_model=UserAdminView,
-            error_models={400: BadRequest, 401: Unauthorized, 403: Forbidden},
+            error_models=self._ERRORS,
         )
 
     @admin_only
@@ -461,12 +498,7 @@ class UsersAPI:
         return self._client.request(
             "DELETE",
             f"/api/v1/users/{user_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -474,12 +506,7 @@ class UsersAPI:
         return await self._client.arequest(
             "DELETE",
             f"/api/v1/users/{user_id}",
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     def get_awards(self, user_id: int):
@@ -506,12 +533,7 @@ class UsersAPI:
             "POST",
             f"/api/v1/users/{user_id}/email",
             json={"text": text},
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
 
     @admin_only
@@ -520,10 +542,5 @@ class UsersAPI:
             "POST",
             f"/api/v1/users/{user_id}/email",
             json={"text": text},
-            error_models={
-                400: BadRequest,
-                401: Unauthorized,
-                403: Forbidden,
-                404: NotFound,
-            },
+            error_models=self._NOT_FOUND_ERRORS,
         )
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import os
 from contextvars import ContextVar
-from types import TracebackType
-from typing import Any, Callable, Generic, Type, TypeVar, cast, overload
+from functools import lru_cache
+from types import GenericAlias, TracebackType, UnionType
+from typing import Any, Callable, Generic, Mapping, Type, TypeVar, cast, overload
 
 import httpx
 from httpx._types import (
@@ -14,19 +15,71 @@ from httpx._types import (
     RequestData,
     RequestFiles,
 )
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import SchemaValidator, core_schema
+from typing_extensions import TypedDict
 
 from ctfdpy.api import APIMixin
 from ctfdpy.auth import BaseAuthStrategy, TokenAuthStrategy, UnauthAuthStrategy
 from ctfdpy.auth.credentials import CredentialAuthStrategy
 from ctfdpy.exceptions import APIResponseException, CTFdpyException, RequestTimeout
+from ctfdpy.models.model import CreatePayloadModel, UpdatePayloadModel
 from ctfdpy.types.api import APIResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 T = TypeVar("T")
 A = TypeVar("A", bound=BaseAuthStrategy)
 AS = TypeVar("AS", bound=BaseAuthStrategy)
 
 
+class _DataEnvelope(Generic[T], TypedDict, total=False):
+    data: T | None
+
+
+@lru_cache(maxsize=256)
+def _get_envelope_adapter(type_: Any) -> TypeAdapter[_DataEnvelope[Any]]:
+    return TypeAdapter(_DataEnvelope[type_])
+
+
+@lru_cache(maxsize=256)
+def _wrap_adapter_schema(adapter: TypeAdapter[Any]) -> SchemaValidator:
+    # The type behind an adapter is not exposed, so its schema is wrapped instead
+    return SchemaValidator(
+        core_schema.typed_dict_schema(
+            {
+                "data": core_schema.typed_dict_field(
+                    core_schema.nullable_schema(adapter.core_schema), required=False
+                )
+            }
+        )
+    )
+
+
+def _get_envelope_validator(
+    response_model: Any,
+) -> TypeAdapter[_DataEnvelope[Any]] | SchemaValidator:
+    # Validates the `data` key of a raw response body, so the JSON is parsed and
+    # validated in a single pass without building Python objects first
+    if isinstance(response_model, TypeAdapter):
+        return _wrap_adapter_schema(response_model)
+
+    return _get_envelope_adapter(response_model)
+
+
+@lru_cache(maxsize=256)
+def _get_data_adapter(type_: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(type_)
+
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=40, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+
 class APIClient(Generic[A], APIMixin):
     """
     The main class for interacting with the CTFd API
@@ -42,6 +95,12 @@ class APIClient(Generic[A], APIMixin):
         The user agent to use for requests, by default "CTFdPy/0.1.0"
     follow_redirects : bool, optional
         Whether to follow redirects, by default False
+    limits : httpx.Limits, optional
+        The connection pool limits to use for the underlying HTTP clients, by default
+        40 connections with up to 20 kept alive for 30 seconds
+    http2 : bool, optional
+        Whether to negotiate HTTP/2 with the server, by default False.
+        Requires the `http2` extra to be installed
 
     Attributes
     ----------
@@ -73,6 +132,8 @@ class APIClient(Generic[A], APIMixin):
         *,
         user_agent: str = "CTFdPy/0.1.0",
         follow_redirects: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ): ...
 
     @overload
@@ -83,6 +144,8 @@ class APIClient(Generic[A], APIMixin):
         *,
         user_agent: str = "CTFdPy/0.1.0",
         follow_redirects: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ): ...
 
     @overload
@@ -93,6 +156,8 @@ class APIClient(Generic[A], APIMixin):
         *,
         user_agent: str = "CTFdPy/0.1.0",
         follow_redirects: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ): ...
 
     def __init__(
@@ -102,6 +167,8 @@ class APIClient(Generic[A], APIMixin):
         *,
         user_agent: str = "CTFdPy/0.1.0",
         follow_redirects: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ):
         if isinstance(auth, str):
             auth = TokenAuthStrategy(auth)
@@ -113,6 +180,11 @@ class APIClient(Generic[A], APIMixin):
         self.url = httpx.URL(url)
         self._user_agent = user_agent
         self._follow_redirects = follow_redirects
+        self._limits = limits
+        self._http2 = http2
+
+        # The rejecting responses of admin-only endpoints the user is not allowed to use
+        self._non_admin_responses: dict[str, httpx.Response] = {}
 
         self.__sync_client: ContextVar[httpx.Client | None] = ContextVar(
             "sync_client", default=None
@@ -123,7 +195,17 @@ class APIClient(Generic[A], APIMixin):
 
         super().__init__(self)
 
-    def _get_client_defaults(self) -> dict[str, str]:
+    def invalidate_admin_cache(self) -> None:
+        """
+        Forget which admin-only endpoints rejected the current user
+
+        Admin-only endpoints remember when a request was rejected because the user is not
+        an admin and fail fast afterwards. Call this after changing the user's permissions
+        or the authentication strategy.
+        """
+        self._non_admin_responses.clear()
+
+    def _get_client_defaults(self) -> dict[str, Any]:
         auth_flow = None
         if self.auth is not None:
             auth_flow = self.auth.get_auth_flow(self)
@@ -135,6 +217,8 @@ class APIClient(Generic[A], APIMixin):
             "base_url": self.url,
             "headers": headers,
             "follow_redirects": self._follow_redirects,
+            "limits": self._limits,
+            "http2": self._http2,
         }
 
     def _create_sync_client(self) -> httpx.Client:
@@ -213,41 +297,23 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
     ) -> httpx.Response:
         client = self.get_sync_client()
 
-        if headers is not None:
-            try:
-                content_type = headers["Content-Type"]
-
-                if content_type == "multipart/form-data":
-                    # We have to do some special handling for multipart/form-data
-                    # because httpx needs to set the boundary in the headers
-                    # so we just not set the content-type header and let httpx handle it
-                    headers.pop("Content-Type")
-            except TypeError:
-                # headers is a sequence of key-value pairs
-                for header in headers:
-                    if header[0].lower() == "content-type":
-                        content_type = header[1]
-
-                        if content_type == "multipart/form-data":
-                            # We have to do some special handling for multipart/form-data
-                            # because httpx needs to set the boundary in the headers
-                            # so we just not set the content-type header and let httpx handle it
-                            headers = [header for header in headers if header[0].lower() != "content-type"]
-                            
-                        break
-                else:
-                    # Default to application/json
-                    headers.append(("Content-Type", "application/json"))
-            except KeyError:
-                # headers is a mapping and content-type is not present
-                # Default to application/json
-                headers["Content-Type"] = "application/json"
-                
+        if payload is not None or (json is not None and orjson is not None):
+            if payload is not None:
+                content = payload.to_json()
+            else:
+                # Serialize the body ourselves so httpx doesn't fall back to the stdlib json module
+                content = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+                json = None
+            # httpx only sets the JSON content type for bodies it encodes itself
+            headers = httpx.Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
+
         try:
             return client.request(
                 method,
@@ -275,40 +341,22 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
     ) -> httpx.Response:
         client = self.get_async_client()
 
-        if headers is not None:
-            try:
-                content_type = headers["Content-Type"]
-
-                if content_type == "multipart/form-data":
-                    # We have to do some special handling for multipart/form-data
-                    # because httpx needs to set the boundary in the headers
-                    # so we just not set the content-type header and let httpx handle it
-                    headers.pop("Content-Type")
-            except TypeError:
-                # headers is a sequence of key-value pairs
-                for header in headers:
-                    if header[0].lower() == "content-type":
-                        content_type = header[1]
-
-                        if content_type == "multipart/form-data":
-                            # We have to do some special handling for multipart/form-data
-                            # because httpx needs to set the boundary in the headers
-                            # so we just not set the content-type header and let httpx handle it
-                            headers = [header for header in headers if header[0].lower() != "content-type"]
-
-                        break
-                else:
-                    # Default to application/json
-                    headers.append(("Content-Type", "application/json"))
-            except KeyError:
-                # headers is a mapping and content-type is not present
-                # Default to application/json
-                headers["Content-Type"] = "application/json"
+        if payload is not None or (json is not None and orjson is not None):
+            if payload is not None:
+                content = payload.to_json()
+            else:
+                # Serialize the body ourselves so httpx doesn't fall back to the stdlib json module
+                content = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+                json = None
+            # httpx only sets the JSON content type for bodies it encodes itself
+            headers = httpx.Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
 
         try:
             return await client.request(
@@ -331,7 +379,7 @@ class APIClient(Generic[A], APIMixin):
     def _handle_response(
         self,
         response: httpx.Response,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> bool | APIResponse: ...
 
     @overload
@@ -339,7 +387,7 @@ class APIClient(Generic[A], APIMixin):
         self,
         response: httpx.Response,
         response_model: Type[T] | TypeAdapter[T] | Callable[[APIResponse], T],
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T: ...
 
     def _handle_response(
@@ -348,45 +396,67 @@ class APIClient(Generic[A], APIMixin):
         response_model: (
             Type[T] | TypeAdapter[T] | Callable[[APIResponse], T] | None
         ) = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T | bool | APIResponse:
-        if not response.is_success:
-            error_models = error_models or {}
-            status_code = response.status_code
-
-            # This is uh... not great
-            error_model = error_models.get(
-                status_code,
-                error_models.get(
-                    f"{str(status_code)[0]}XX",
-                    error_models.get("default", APIResponseException),
-                ),
-            )
+        status_code = response.status_code
+        if not 200 <= status_code < 300:
+            error_model = APIResponseException
+            if error_models:
+                # Fall back from the exact status code to the status class, then the default,
+                # only computing the fallback keys when they are actually needed
+                error_model = (
+                    error_models.get(status_code)
+                    or error_models.get(f"{status_code // 100}XX")
+                    or error_models.get("default", APIResponseException)
+                )
 
             raise error_model(response=response)
 
-        response_data: APIResponse = response.json()
+        # Other classes are treated as callables and given the whole response
+        envelope_validator = None
+        if isinstance(response_model, (TypeAdapter, GenericAlias, UnionType)) or (
+            isinstance(response_model, type) and issubclass(response_model, BaseModel)
+        ):
+            envelope_validator = _get_envelope_validator(response_model)
+
+        if envelope_validator is not None:
+            # A 2xx status already implies `success`, so only the payload is validated
+            try:
+                data = envelope_validator.validate_json(response.content).get("data")
+            except ValidationError:
+                # Errors from the envelope are named after it and located under `data`,
+                # so the payload is validated again on its own to raise the model's error
+                pass
+            else:
+                if data is None:
+                    raise ValueError("Response data expected to have 'data' key")
+                return data
+
+        if orjson is not None:
+            response_data: APIResponse = orjson.loads(response.content)
+        else:
+            response_data: APIResponse = response.json()
 
         if response_model is None:
             try:
                 return response_data["success"]
             except KeyError:
                 return response_data
-        elif response_data.get("data") is None:
-            raise ValueError("Response data expected to have 'data' key")
 
-        if isinstance(response_model, type) and issubclass(response_model, BaseModel):
-            response_data = response_model.model_validate(response_data["data"])
-        elif isinstance(response_model, TypeAdapter):
-            response_data = response_model.validate_python(response_data["data"])
+        if envelope_validator is not None:
+            data = response_data.get("data")
+            if data is None:
+                raise ValueError("Response data expected to have 'data' key")
+
+            if not isinstance(response_model, TypeAdapter):
+                response_model = _get_data_adapter(response_model)
+            return response_model.validate_python(data)
         elif callable(response_model):
-            response_data = response_model(response_data)
+            return response_model(response_data)
         else:
             # This should never happen
             raise ValueError("Invalid response model")
 
-        return response_data
-
     @overload
     def request(
         self,
@@ -398,9 +468,10 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> bool | APIResponse: ...
 
     @overload
@@ -415,9 +486,10 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T: ...
 
     def request(
@@ -430,12 +502,13 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
         response_model: (
             Type[T] | TypeAdapter[T] | Callable[[APIResponse], T] | None
         ) = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T | bool | APIResponse:
         response = self._request(
             method,
@@ -445,11 +518,14 @@ class APIClient(Generic[A], APIMixin):
             data=data,
             files=files,
             json=json,
+            payload=payload,
             headers=headers,
             cookies=cookies,
         )
         return self._handle_response(
-            response, response_model=response_model, error_models=error_models
+            response,
+            response_model=response_model,
+            error_models=error_models,
         )
 
     @overload
@@ -463,9 +539,10 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> bool | APIResponse: ...
 
     @overload
@@ -480,9 +557,10 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T: ...
 
     async def arequest(
@@ -495,12 +573,13 @@ class APIClient(Generic[A], APIMixin):
         data: RequestData | None = None,
         files: RequestFiles | None = None,
         json: Any | None = None,
+        payload: CreatePayloadModel | UpdatePayloadModel | None = None,
         headers: HeaderTypes | None = None,
         cookies: CookieTypes | None = None,
         response_model: (
             Type[T] | TypeAdapter[T] | Callable[[APIResponse], T] | None
         ) = None,
-        error_models: dict[str, APIResponseException] | None = None,
+        error_models: Mapping[int | str, type[APIResponseException]] | None = None,
     ) -> T | bool | APIResponse:
         response = await self._arequest(
             method,
@@ -510,11 +589,14 @@ class APIClient(Generic[A], APIMixin):
             data=data,
             files=files,
             json=json,
+            payload=payload,
             headers=headers,
             cookies=cookies,
         )
         return self._handle_response(
-            response, response_model=response_model, error_models=error_models
+            response,
+            response_model=response_model,
+            error_models=error_models,
         )
 
     @overload
@@ -524,6 +606,8 @@ class APIClient(Generic[A], APIMixin):
         *,
         user_agent: str = "CTFdPy/0.1.0",
         follow_redirects: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
     ) -> APIClient[AS]: ...
 
     @classmethod
@@ -538,19 +622,20 @@ class APIClient(Generic[A], APIMixin):
         - `CTFD_USERNAME`: The username to use for authentication
         - `CTFD_PASSWORD`: The password to use for authentication
         """
-        url = os.getenv("CTFD_URL")
-        if url is None:
+        env = os.environ
+
+        url = env.get("CTFD_URL")
+        if not url:
             raise ValueError("CTFD_URL environment variable must be set")
 
         auth = None
 
-        token = os.getenv("CTFD_TOKEN")
-        if token is not None:
+        # Empty variables are treated as unset, and a token takes priority over credentials
+        if token := env.get("CTFD_TOKEN"):
             auth = TokenAuthStrategy(token)
-
-        username = os.getenv("CTFD_USERNAME")
-        password = os.getenv("CTFD_PASSWORD")
-        if username is not None and password is not None and auth is None:
+        elif (username := env.get("CTFD_USERNAME")) and (
+            password := env.get("CTFD_PASSWORD")
+        ):
             auth = CredentialAuthStrategy(username, password)
 
         return cls(url, auth, **kwargs)
@@ -17,11 +17,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 if TYPE_CHECKING:
     from httpx import Request, Response
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class CTFdpyException(Exception):
     """
@@ -56,6 +63,23 @@ class APIResponseException(CTFdpyException):
         self.response = response
         super().__init__(*args)
 
+    @cached_property
+    def data(self) -> Any | None:
+        """
+        The decoded JSON body of the response, or `None` if there is no response or it is not JSON
+
+        The body is only decoded once, no matter how many times this is accessed.
+        """
+        if self.response is None:
+            return None
+
+        try:
+            if orjson is not None:
+                return orjson.loads(self.response.content)
+            return self.response.json()
+        except ValueError:
+            return None
+
 
 class BadRequest(APIResponseException):
     """
@@ -119,3 +143,18 @@ class ModelValidationError(CTFdpyException):
     """
 
     pass
+
+
+BASE_ERROR_MAP: Mapping[int, type[APIResponseException]] = MappingProxyType(
+    {400: BadRequest, 401: Unauthorized, 403: Forbidden}
+)
+"""
+The status code to exception mapping for endpoints that do not look up a resource
+"""
+
+DEFAULT_ERROR_MAP: Mapping[int, type[APIResponseException]] = MappingProxyType(
+    {400: BadRequest, 401: Unauthorized, 403: Forbidden, 404: NotFound}
+)
+"""
+The status code to exception mapping shared by most endpoints
+"""
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping
 
-from pydantic import AliasChoices, Field, model_validator
+from pydantic import AliasChoices, Field, field_validator, model_validator
 
 from ctfdpy.models.model import CreatePayloadModel, ResponseModel
-from ctfdpy.types.files import CreateFilePayloadDict, MultipartFileTypes
+from ctfdpy.types.files import (
+    BinaryFileReader,
+    CreateFilePayloadDict,
+    MultipartFileTypes,
+)
+
+
+_FILE_CONTENT_TYPES = (BinaryFileReader, bytes, str)
 
 
 class FileType(StrEnum):
@@ -195,7 +202,9 @@ class CreateFilePayload(CreatePayloadModel, arbitrary_types_allowed=True):
         The location to upload the files to. Cannot be specified if multiple files are provided
     """
 
-    files: list[MultipartFileTypes]  # this might be slow...
+    # This is really `list[MultipartFileTypes]`, but validating that nested union through pydantic
+    # produces a huge core schema, so the shape is checked by hand in `check_files` instead
+    files: list[Any]
     type: FileType = FileType.STANDARD
     challenge_id: int | None = Field(
         None, validation_alias=AliasChoices("challenge_id", "challenge")
@@ -247,34 +256,66 @@ class CreateFilePayload(CreatePayloadModel, arbitrary_types_allowed=True):
             warnings: bool = True,
         ) -> CreateFilePayloadDict: ...
 
-    @model_validator(mode="after")
-    def check_file_type(self) -> CreateFilePayload:
-        match self.type:
-            case FileType.STANDARD:
-                if self.challenge_id is not None or self.page_id is not None:
-                    raise ValueError(
-                        "Challenge ID and page ID must be None for standard files"
-                    )
-            case FileType.CHALLENGE:
-                if self.challenge_id is None:
+    @field_validator("files", mode="after")
+    @classmethod
+    def check_files(cls, files: list[Any]) -> list[MultipartFileTypes]:
+        for i, file in enumerate(files):
+            if isinstance(file, list):
+                file = files[i] = tuple(file)
+
+            if isinstance(file, tuple):
+                if not 2 <= len(file) <= 4:
                     raise ValueError(
-                        "Challenge ID must be provided for challenge files"
+                        "File tuples must be in the format (filename, file, content_type, headers)"
                     )
-                if self.page_id is not None:
-                    raise ValueError("Page ID must be None for challenge files")
-            case FileType.PAGE:
-                if self.page_id is None:
-                    raise ValueError("Page ID must be provided for page files")
-                if self.challenge_id is not None:
-                    raise ValueError("Challenge ID must be None for page files")
-        return self
+                if not isinstance(file[0], str | None):
+                    raise ValueError("File name must be a string or None")
+                if not isinstance(file[1], _FILE_CONTENT_TYPES):
+                    raise ValueError("File content must be a binary file, bytes or str")
+                if len(file) > 2 and not isinstance(file[2], str | None):
+                    raise ValueError("Content type must be a string or None")
+                if len(file) > 3 and not isinstance(file[3], Mapping):
+                    raise ValueError("Headers must be a mapping")
+            elif not isinstance(file, _FILE_CONTENT_TYPES):
+                raise ValueError("File must be a binary file, bytes, str or a tuple")
+
+        return files
 
     @model_validator(mode="after")
-    def check_file_count(self) -> CreateFilePayload:
-        if len(self.files) == 0:
+    def check_payload(self) -> CreateFilePayload:
+        _FILE_TYPE_CHECKS[self.type](self)
+
+        if not self.files:
             raise ValueError("At least one file must be provided")
-        elif len(self.files) > 1 and self.location is not None:
+        if self.location is not None and len(self.files) > 1:
             raise ValueError(
                 "Location cannot be specified when multiple files are provided"
             )
         return self
+
+
+def _check_standard_file(payload: CreateFilePayload) -> None:
+    if payload.challenge_id is not None or payload.page_id is not None:
+        raise ValueError("Challenge ID and page ID must be None for standard files")
+
+
+def _check_challenge_file(payload: CreateFilePayload) -> None:
+    if payload.challenge_id is None:
+        raise ValueError("Challenge ID must be provided for challenge files")
+    if payload.page_id is not None:
+        raise ValueError("Page ID must be None for challenge files")
+
+
+def _check_page_file(payload: CreateFilePayload) -> None:
+    if payload.page_id is None:
+        raise ValueError("Page ID must be provided for page files")
+    if payload.challenge_id is not None:
+        raise ValueError("Challenge ID must be None for page files")
+
+
+# `type` is stored as its plain string value, which hashes the same as the enum member
+_FILE_TYPE_CHECKS: dict[FileType, Callable[[CreateFilePayload], None]] = {
+    FileType.STANDARD: _check_standard_file,
+    FileType.CHALLENGE: _check_challenge_file,
+    FileType.PAGE: _check_page_file,
+}
@@ -12,8 +12,11 @@ class Model(BaseModel):
     This class should not be instantiated directly
     """
 
+    # Schemas are built on first use rather than at import time
     model_config = ConfigDict(
-        extra="allow", use_enum_values=True, validate_assignment=True
+        extra="ignore",
+        use_enum_values=True,
+        defer_build=True,
     )
 
 
@@ -36,6 +39,8 @@ class CreatePayloadModel(Model, extra="forbid"):
         """
         Dumps the model in JSON format
 
+        This builds an intermediate dict, so use `to_json` when the payload is only being sent in a request
+
         Parameters
         ----------
         kwargs : dict[str, Any]
@@ -48,6 +53,22 @@ class CreatePayloadModel(Model, extra="forbid"):
         """
         return self.model_dump(mode="json", exclude_unset=True, **kwargs)
 
+    def to_json(self, **kwargs) -> str:
+        """
+        Serializes the model to a JSON string in a single pass
+
+        Parameters
+        ----------
+        kwargs : dict[str, Any]
+            Additional keyword arguments to pass to the model dump
+
+        Returns
+        -------
+        str
+            The JSON encoded payload
+        """
+        return self.model_dump_json(exclude_unset=True, **kwargs)
+
 
 class UpdatePayloadModel(Model, extra="forbid"):
     """
@@ -60,6 +81,8 @@ class UpdatePayloadModel(Model, extra="forbid"):
         """
         Dumps the model in JSON format
 
+        This builds an intermediate dict, so use `to_json` when the payload is only being sent in a request
+
         Parameters
         ----------
         kwargs : dict[str, Any]
@@ -71,3 +94,19 @@ class UpdatePayloadModel(Model, extra="forbid"):
             The payload
         """
         return self.model_dump(mode="json", exclude_unset=True, **kwargs)
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Serializes the model to a JSON string in a single pass
+
+        Parameters
+        ----------
+        kwargs : dict[str, Any]
+            Additional keyword arguments to pass to the model dump
+
+        Returns
+        -------
+        str
+            The JSON encoded payload
+        """
+        return self.model_dump_json(exclude_unset=True, **kwargs)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from functools import wraps
+import asyncio
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import cache, wraps
 from inspect import isawaitable
-from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, ParamSpec, TypeVar
 
-from httpx import Response
+from pydantic import TypeAdapter
 
 from ctfdpy.auth.unauth import UnauthAuthStrategy
 from ctfdpy.exceptions import AdminOnly, AuthenticationError, Forbidden
@@ -13,13 +16,14 @@ if TYPE_CHECKING:
     from ctfdpy.client import APIClient
 
 T = TypeVar("T")
+U = TypeVar("U")
 P = ParamSpec("P")
 
+DEFAULT_CONCURRENCY = 8
 
-class _MissingSentinel:
-    def __eq__(self, other) -> bool:
-        return False
 
+class _MissingSentinel:
+    # Compare with `is`, the default identity based `__eq__` and `__hash__` are kept
     def __bool__(self) -> bool:
         return False
 
@@ -34,6 +38,15 @@ class _API:
     _client: APIClient
 
 
+def lazy_type_adapter(type_: Any) -> Callable[[], TypeAdapter[Any]]:
+    """
+    Returns a function that builds a `TypeAdapter` for `type_` on its first call and caches it.
+
+    Building the core schema of an adapter is expensive, so this keeps it off the import path.
+    """
+    return cache(lambda: TypeAdapter(type_))
+
+
 def auth_only(f: Callable[P, T]) -> Callable[P, T]:
     """
     Wrapper for endpoints that require the user to be authenticated.
@@ -51,22 +64,28 @@ def auth_only(f: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
-def _is_non_admin_response(response: Response) -> bool:
-    try:
-        data = response.json()
-    except Exception:
+# Common to the default Flask 403 message however the apostrophe in it was escaped,
+# so a raw body without it can be ruled out without decoding any JSON
+_NON_ADMIN_SENTINEL = b"permission to access the requested resource"
+
+_NON_ADMIN_MESSAGE = (
+    "You don't have the permission to access the requested"
+    " resource. It is either read-protected or not readable by the"
+    " server."
+)
+
+
+def _is_non_admin_error(error: Forbidden) -> bool:
+    if error.response is None or _NON_ADMIN_SENTINEL not in error.response.content:
+        return False
+
+    data = error.data
+    if not isinstance(data, dict):
         return False
 
     # This is a bit hacky, we look for the default Flask 403 error message
     # This is dangerous as the endpoints might raise this error message as well
-    if data.get("message") == (
-        "You don't have the permission to access the requested"
-        " resource. It is either read-protected or not readable by the"
-        " server."
-    ):
-        return True
-
-    return False
+    return data.get("message") == _NON_ADMIN_MESSAGE
 
 
 def admin_only(f: Callable[P, T]) -> Callable[P, T]:
@@ -74,17 +93,30 @@ def admin_only(f: Callable[P, T]) -> Callable[P, T]:
     Wrapper for endpoints that require the user to be an admin.
 
     Raises an `AdminOnly` exception if the user is not an admin, or `AuthenticationRequired` if the user is not authenticated.
+
+    Once an endpoint rejects the user for not being an admin, this is remembered on the client and
+    later calls to the same endpoint fail immediately. Other endpoints are unaffected, as some admin-only
+    endpoints also serve non-admins. Use `APIClient.invalidate_admin_cache` to reset it.
     """
+    # The sync and async variants of a method share an endpoint
+    endpoint = f.__qualname__.replace(".async_", ".")
 
     @wraps(f)
     def wrapper(self: _API, *args: P.args, **kwargs: P.kwargs) -> T:
-        if isinstance(self._client.auth, UnauthAuthStrategy):
+        client = self._client
+
+        if isinstance(client.auth, UnauthAuthStrategy):
             raise AuthenticationError("Authentication required to access this endpoint")
 
+        response = client._non_admin_responses.get(endpoint)
+        if response is not None:
+            raise AdminOnly("Admin user required", response=response)
+
         try:
             result = f(self, *args, **kwargs)
         except Forbidden as e:
-            if _is_non_admin_response(e.response):
+            if _is_non_admin_error(e):
+                client._non_admin_responses[endpoint] = e.response
                 raise AdminOnly("Admin user required", response=e.response)
             else:
                 raise e from e
@@ -93,15 +125,81 @@ def admin_only(f: Callable[P, T]) -> Callable[P, T]:
 
             async def _wrapper() -> T:
                 try:
-                    return await result
+                    awaited = await result
                 except Forbidden as e:
-                    if _is_non_admin_response(e.response):
+                    if _is_non_admin_error(e):
+                        client._non_admin_responses[endpoint] = e.response
                         raise AdminOnly("Admin user required", response=e.response)
                     else:
                         raise e from e
 
+                return awaited
+
             return _wrapper()
         else:
             return result
 
     return wrapper
+
+
+def run_concurrently(
+    client: APIClient,
+    func: Callable[[U], T],
+    items: Iterable[U],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[T]:
+    """
+    Calls `func` on every item using a thread pool and returns the results in order.
+
+    The workers run in a copy of the current context so that they share the
+    client's pooled HTTP client instead of each creating their own.
+
+    If a call raises, the calls that have not started yet are cancelled and the
+    exception is raised once the calls already running have finished.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    client.get_sync_client()
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [executor.submit(copy_context().run, func, item) for item in items]
+
+        _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        if not_done:
+            executor.shutdown(cancel_futures=True)
+
+        return [future.result() for future in futures if not future.cancelled()]
+
+
+async def async_run_concurrently(
+    client: APIClient,
+    func: Callable[[U], Awaitable[T]],
+    items: Iterable[U],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[T]:
+    """
+    Awaits `func` on every item with at most `concurrency` calls in flight and returns the results in order.
+
+    If a call raises, the other calls are cancelled before the exception is raised.
+    """
+    # Make sure the HTTP client exists before spawning tasks, otherwise
+    # each task would create its own client in its copied context
+    client.get_async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: U) -> T:
+        async with semaphore:
+            return await func(item)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run(item)) for item in items]
+    except BaseExceptionGroup as e:
+        # Callers expect the API exception itself rather than a group
+        raise e.exceptions[0] from None
+
+    return [task.result() for task in tasks]